@@ -44,8 +44,8 @@ executor = ThreadPoolExecutor(max_workers=3)
 
 # Add logging at application startup
 logger.info("=== Application Initialization Started ===")
-logger.info(f"Project root path: {PROJECT_ROOT}")
-logger.info(f"Python path: {os.environ['PYTHONPATH']}")
+logger.info("Project root path: %s", PROJECT_ROOT)
+logger.info("Python path: %s", os.environ['PYTHONPATH'])
 logger.info("Loading Flask application and dependencies...")
 
 # Add this near the top with other config imports
@@ -53,13 +53,13 @@ logger.info("Loading Flask application and dependencies...")
 async def execute_generate_command(agent_type, agent_name, topic=None, image_prompt=None, webhook_url=None, chaos_percentage="0"):
     """Execute the command using the BlogAgent directly."""
     logger.info("\n=== New Generation Command Started ===")
-    logger.info(f"Parameters received:")
-    logger.info(f"  - Agent Type: {agent_type}")
-    logger.info(f"  - Agent Name: {agent_name}")
-    logger.info(f"  - Topic: {topic}")
-    logger.info(f"  - Image Prompt: {image_prompt}")
-    logger.info(f"  - Webhook URL: {webhook_url}")
-    logger.info(f"  - Chaos Percentage: {chaos_percentage}")
+    logger.info("Parameters received:")
+    logger.info("  - Agent Type: %s", agent_type)
+    logger.info("  - Agent Name: %s", agent_name)
+    logger.info("  - Topic: %s", topic)
+    logger.info("  - Image Prompt: %s", image_prompt)
+    logger.info("  - Webhook URL: %s", webhook_url)
+    logger.info("  - Chaos Percentage: %s", chaos_percentage)
     
     try:
         # Update the chaos percentage manager
@@ -86,7 +86,7 @@ async def execute_generate_command(agent_type, agent_name, topic=None, image_pro
         # Extract filename from filepath if it exists
         filename = Path(filepath).name if filepath else None
             
-        logger.info(f"execute_generate_command Command execution completed - Success: {success}, Output: {message}, Filename: {filename}, Filepath: {filepath}")
+        logger.info("execute_generate_command Command execution completed - Success: %s, Output: %s, Filename: %s, Filepath: %s", success, message, filename, filepath)
         return success, message, filepath, filename
             
     except Exception as e:
@@ -146,7 +146,7 @@ def start_server():
     try:
         data = request.json
         command = data.get('command')
-        logger.info(f"Received command: {command}")
+        logger.info("Received command: %s", command)
         
         if not command:
             logger.error("No command provided")
@@ -154,7 +154,7 @@ def start_server():
 
         # Split the command safely
         args = shlex.split(command)
-        logger.info(f"Executing command with args: {args}")
+        logger.info("Executing command with args: %s", args)
 
         # Start the process in the background
         subprocess.Popen(
@@ -164,7 +164,7 @@ def start_server():
             text=True
         )
 
-        logger.info(f"Successfully started process: {command}")
+        logger.info("Successfully started process: %s", command)
         return jsonify({'success': True, 'message': f'Started {command}'})
     except Exception as e:
         logger.error(f"Error starting server: {str(e)}", exc_info=True)
@@ -175,18 +175,18 @@ async def generate():
     try:
         logger.info("Generate endpoint called")
         data = request.get_json()
-        logger.info(f"Received data: {data}")
+        logger.info("Received data: %s", data)
         
         agent_type = data.get('agent_type')
         agent_name = data.get('agent_name')
-        logger.info(f"Agent type: {agent_type}, Agent name: {agent_name}")
+        logger.info("Agent type: %s, Agent name: %s", agent_type, agent_name)
         
         if agent_type == BLOG_RESEARCHER_AI_AGENT:
             topic = data.get('topic')
             if not topic:
                 logger.error("Topic is required for researcher agent but was not provided")
                 return jsonify({'success': False, 'message': 'Topic is required for researcher agent'})
-            logger.info(f"Executing researcher command with topic: {topic}")
+            logger.info("Executing researcher command with topic: %s", topic)
             success, output, filepath, filename = await execute_generate_command(agent_type, agent_name, topic=topic)
         elif agent_type == BLOG_ARTIST_AI_AGENT:
             webhook_url = data.get('webhook_url')
@@ -200,7 +200,7 @@ async def generate():
             # Update the global chaos percentage
             chaos_percentage_manager.update(chaos_percentage)
             
-            logger.info(f"Executing artist command with prompt: {image_prompt}, webhook: {webhook_url}, chaos: {chaos_percentage}")
+            logger.info("Executing artist command with prompt: %s, webhook: %s, chaos: %s", image_prompt, webhook_url, chaos_percentage)
             success, output, filepath, filename = await execute_generate_command(
                 agent_type, 
                 agent_name, 
@@ -209,7 +209,7 @@ async def generate():
                 chaos_percentage=chaos_percentage
             )
 
-        logger.info(f"generate Command execution completed - Success: {success}, Output: {output}, Filename: {filename}, Filepath: {filepath}")
+        logger.info("generate Command execution completed - Success: %s, Output: %s, Filename: %s, Filepath: %s", success, output, filename, filepath)
         return jsonify({
             'success': success,
             'message': output,
@@ -277,11 +277,11 @@ async def generate_voice():
         # Get the filename from the request
         data = request.get_json()
         original_filename = data.get('filename', '')
-        logger.info(f"Original blog post filename: {original_filename}")
+        logger.info("Original blog post filename: %s", original_filename)
         
         # Load content from config file
         config_path = Path('tmp/config.json')
-        logger.info(f"Looking for config file at: {config_path} (absolute: {config_path.absolute()})")
+        logger.info("Looking for config file at: %s (absolute: %s)", config_path, config_path.absolute())
         
         if not config_path.exists():
             logger.error(f"Config file not found at: {config_path}")
@@ -304,7 +304,7 @@ async def generate_voice():
                     'message': 'No blog content found in config file'
                 })
             
-            logger.info(f"Successfully loaded blog content (length: {len(text)} characters)")
+            logger.info("Successfully loaded blog content (length: %s characters)", len(text))
             
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse config file: {str(e)}")
@@ -316,7 +316,7 @@ async def generate_voice():
         # Clean up the text
         logger.info("Processing text for voice generation...")
         text = ' '.join(text.split())  # Clean up whitespace
-        logger.info(f"Processed text length: {len(text)} characters")
+        logger.info("Processed text length: %s characters", len(text))
         
         # Call ElevenLabs API
         logger.info("Preparing ElevenLabs API call...")
@@ -338,7 +338,7 @@ async def generate_voice():
 
         logger.info("Making request to ElevenLabs API...")
         response = requests.post(url, json=data, headers=headers)
-        logger.info(f"ElevenLabs API response status code: {response.status_code}")
+        logger.info("ElevenLabs API response status code: %s", response.status_code)
         
         if response.status_code != 200:
             logger.error(f"ElevenLabs API error response: {response.text}")
@@ -349,18 +349,18 @@ async def generate_voice():
 
         # Ensure the output directory exists
         output_dir = Path(OBSIDIAN_AI_POSTS_PATH)
-        logger.info(f"Creating output directory if needed: {output_dir}")
+        logger.info("Creating output directory if needed: %s", output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate filename based on original blog post name
         audio_filename = original_filename.replace('.md', '_voice.mp3')
         output_path = output_dir / audio_filename
-        logger.info(f"Saving audio file to: {output_path}")
+        logger.info("Saving audio file to: %s", output_path)
         
         with open(output_path, 'wb') as f:
             f.write(response.content)
         
-        logger.info(f"Audio file saved successfully. Size: {len(response.content)} bytes")
+        logger.info("Audio file saved successfully. Size: %s bytes", len(response.content))
         logger.info("=== Voice Over Generation Completed Successfully ===")
             
         return jsonify({
@@ -392,7 +392,7 @@ async def cleanup():
 
 def signal_handler(signame):
     """Handle shutdown signals gracefully."""
-    logger.info(f"Received signal {signame}")
+    logger.info("Received signal %s", signame)
     # Run cleanup
     loop = asyncio.get_event_loop()
     if not loop.is_closed():
@@ -416,9 +416,9 @@ if __name__ == '__main__':
     config.bind = ["0.0.0.0:9229"]
     config.use_reloader = True
     
-    logger.info(f"Server configuration:")
-    logger.info(f"  - Bind address: {config.bind}")
-    logger.info(f"  - Reloader enabled: {config.use_reloader}")
+    logger.info("Server configuration:")
+    logger.info("  - Bind address: %s", config.bind)
+    logger.info("  - Reloader enabled: %s", config.use_reloader)
     logger.info("Starting server...")
     
     try:
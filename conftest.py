@@ -0,0 +1,13 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Make the blogi package importable and satisfy the settings config.py reads at import time
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("OBSIDIAN_NOTES_PATH", tempfile.gettempdir())
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-key")
+
+# Load the package under its real name first; test modules inside core/ are collected as a
+# top-level "core" package, and importing that cold would re-enter blogi.core mid-import
+import blogi.core  # noqa: E402,F401
@@ -1,10 +1,11 @@
 import os
+import asyncio
 import logging
 import anthropic
 import aiohttp
 import aiofiles
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Dict
 from datetime import datetime
 from dotenv import load_dotenv
 from contextlib import asynccontextmanager
@@ -34,6 +35,9 @@ from blogi.core.config import (
         BLOG_ARTIST_RANDOM_PROMPT_ARTIST
     )
 
+# Filler words for filename summaries shorter than five words
+_FILENAME_PAD = ('Update',) * 5
+
 async def generate_blog_image(image_prompt: str, webhook_url: str) -> None:
     """Generate blog image using Midjourney service."""
     if not image_prompt or not webhook_url:
@@ -61,17 +65,16 @@ class BlogAgent:
                  model: str = CLAUDE_MODEL):
         
         logger.info("\n=== Initializing BlogAgent ===")
-        logger.info(f"Parameters:")
-        logger.info(f"  - Agent Name: {agent_name}")
-        logger.info(f"  - Agent Type: {agent_type}")
-        logger.info(f"  - Topic: {topic}")
-        logger.info(f"  - Image Prompt: {image_prompt}")
-        logger.info(f"  - Webhook URL: {webhook_url}")
+        logger.info("Parameters:")
+        logger.info("  - Agent Name: %s", agent_name)
+        logger.info("  - Agent Type: %s", agent_type)
+        logger.info("  - Topic: %s", topic)
+        logger.info("  - Image Prompt: %s", image_prompt)
+        logger.info("  - Webhook URL: %s", webhook_url)
         
         self._validate_agent_type(agent_type)
         self._validate_requirements(agent_type, topic, webhook_url)
         
-        self.web_service = WebService()
         self.agent_name = agent_name
         self.agent_type = agent_type
         self.topic = topic
@@ -80,9 +83,12 @@ class BlogAgent:
         self.model = model
         
         # Initialize as None
-        self.sessions = []
+        self._connector = None
+        self._session = None
+        self.web_service = None
         self.anthropic = None
         self.brave_client = None
+        self._prompt_cache: Dict[str, Optional[str]] = {}
         self._is_closed = False
         
         # Set up paths
@@ -107,22 +113,22 @@ class BlogAgent:
     def _setup_paths(self):
         """Set up all required paths."""
         # Set up paths for templates and prompts
-        prompts_base = PROMPTS_DIR
-        agent_prompts = os.path.join(prompts_base, self.agent_name)
-        common_prompts = os.path.join(prompts_base, "_common")
+        prompts_base = Path(PROMPTS_DIR)
+        agent_prompts = prompts_base / self.agent_name
+        common_prompts = prompts_base / "_common"
 
         # Agent-specific paths
-        self.agent_prompt_path = os.path.join(agent_prompts, "agent_prompt.txt")
-        self.enhanced_prompt_path = os.path.join(agent_prompts, "enhanced_prompt.txt")
-        self.disclaimer_path = os.path.join(agent_prompts, "disclaimer.txt")
-        self.blog_page_template_path = os.path.join(agent_prompts, "blog_page_template.md")
+        self.agent_prompt_path = agent_prompts / "agent_prompt.txt"
+        self.enhanced_prompt_path = agent_prompts / "enhanced_prompt.txt"
+        self.disclaimer_path = agent_prompts / "disclaimer.txt"
+        self.blog_page_template_path = agent_prompts / "blog_page_template.md"
         
         # Base paths    
-        self.base_prompts_path = Path(agent_prompts)
-        self.common_prompts_path = Path(common_prompts)
+        self.base_prompts_path = agent_prompts
+        self.common_prompts_path = common_prompts
         
         # Common templates
-        self.frontmatter_path = os.path.join(common_prompts, "frontmatter.md")
+        self.frontmatter_path = self.common_prompts_path / "frontmatter.md"
         self.tags_prompt_path = self.common_prompts_path / "tags_prompt.txt"
         self.title_prompt_path = self.common_prompts_path / "summarize_for_title.txt"
         self.five_words_prompt_path = self.common_prompts_path / "five_word_summary.txt"
@@ -137,13 +143,13 @@ class BlogAgent:
                     webhook_url: str = None):
         """Create a new blog post using the specified agent type and parameters."""
         try:
-            logger.info(f"\n=== BlogAgent.create Started ===")
-            logger.info(f"Parameters:")
-            logger.info(f"  - Agent Type: {agent_type}")
-            logger.info(f"  - Agent Name: {agent_name}")
-            logger.info(f"  - Topic: {topic}")
-            logger.info(f"  - Image Prompt: {image_prompt}")
-            logger.info(f"  - Webhook URL: {webhook_url}")
+            logger.info("\n=== BlogAgent.create Started ===")
+            logger.info("Parameters:")
+            logger.info("  - Agent Type: %s", agent_type)
+            logger.info("  - Agent Name: %s", agent_name)
+            logger.info("  - Topic: %s", topic)
+            logger.info("  - Image Prompt: %s", image_prompt)
+            logger.info("  - Webhook URL: %s", webhook_url)
             
             # If it's a BLOG_ARTIST_RANDOM_PROMPT_ARTIST and no image prompt is provided, generate one
             if agent_name == BLOG_ARTIST_RANDOM_PROMPT_ARTIST and not image_prompt:
@@ -153,7 +159,7 @@ class BlogAgent:
                     image_prompt = await prompt_service.generate_random_prompt()
                     if not image_prompt:
                         raise ValueError("Failed to generate random image prompt")
-                    logger.info(f"Generated random image prompt: {image_prompt}")
+                    logger.info("Generated random image prompt: %s", image_prompt)
                 except Exception as e:
                     logger.error(f"Error generating random prompt: {str(e)}")
                     return False, "Failed to generate random prompt", None, None
@@ -169,14 +175,8 @@ class BlogAgent:
             
             # Use context manager to handle initialization and cleanup
             async with agent:
-                # Generate the blog post using the appropriate generator
-                generator = (
-                    ArtistPostGenerator(agent) if agent_type == BLOG_ARTIST_AI_AGENT
-                    else ResearcherPostGenerator(agent)
-                )
-                
                 # Generate the blog post
-                filename, blog_page = await generator.generate_blog_post()
+                filename, blog_page = await agent.run()
                 
                 # Save the blog post
                 filepath = await agent.save_to_obsidian_notes(filename, blog_page)
@@ -210,29 +210,28 @@ class BlogAgent:
         """Async context manager exit."""
         await self.cleanup()
 
-    async def create_session(self):
-        """Create and track a new client session."""
-        session = aiohttp.ClientSession()
-        self.sessions.append(session)
-        return session
-
     async def initialize_services(self):
         """Initialize all required services."""
         if self._is_closed:
             raise RuntimeError("Agent has been closed")
             
         try:
-            # Create main session
-            main_session = await self.create_session()
-            
             # Initialize services
+            self.web_service = WebService()
             self.anthropic = AnthropicService(self.model)
-            if hasattr(self.anthropic, 'session'):
-                self.anthropic.session = await self.create_session()
             
             if self.agent_type == BLOG_RESEARCHER_AI_AGENT:
-                self.brave_client = BraveSearchClient()
-                self.brave_client.session = await self.create_session()
+                # Only the Brave client talks through aiohttp, so only researchers need the session
+                self._connector = aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=20,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75
+                )
+                self._session = aiohttp.ClientSession(connector=self._connector)
+                self.brave_client = BraveSearchClient(session=self._session)
+
+            await self.load_prompts()
         except Exception as e:
             logger.error(f"Error initializing services: {str(e)}")
             await self.cleanup()
@@ -245,31 +244,33 @@ class BlogAgent:
 
         errors = []
         try:
-            # First cleanup higher-level services that depend on sessions
+            # First cleanup higher-level services concurrently; they are independent of each other
+            teardowns = []
             if self.anthropic:
-                try:
-                    await self.anthropic.cleanup()
-                except Exception as e:
-                    errors.append(f"Error cleaning up anthropic: {str(e)}")
-                self.anthropic = None
-
+                teardowns.append(("cleaning up anthropic", self.anthropic.cleanup()))
             if self.brave_client and hasattr(self.brave_client, 'cleanup'):
-                try:
-                    await self.brave_client.cleanup()
-                except Exception as e:
-                    errors.append(f"Error cleaning up brave client: {str(e)}")
-                self.brave_client = None
+                teardowns.append(("cleaning up brave client", self.brave_client.cleanup()))
+            if self.web_service:
+                teardowns.append(("closing web service", self.web_service.close()))
+
+            results = await asyncio.gather(*[coro for _, coro in teardowns], return_exceptions=True)
+            for (action, _), result in zip(teardowns, results):
+                if isinstance(result, Exception):
+                    errors.append(f"Error {action}: {str(result)}")
 
-            # Then close all tracked sessions
-            for session in self.sessions:
-                if session and not session.closed:
-                    try:
-                        await session.close()
-                    except RuntimeError as e:
-                        if "Event loop is closed" not in str(e):
-                            errors.append(f"Error closing session: {str(e)}")
-                    except Exception as e:
+            self.anthropic = None
+            self.brave_client = None
+            self.web_service = None
+
+            # Then close the shared session once
+            if self._session and not self._session.closed:
+                try:
+                    await self._session.close()
+                except RuntimeError as e:
+                    if "Event loop is closed" not in str(e):
                         errors.append(f"Error closing session: {str(e)}")
+                except Exception as e:
+                    errors.append(f"Error closing session: {str(e)}")
 
         except Exception as e:
             errors.append(f"Error during cleanup: {str(e)}")
@@ -277,25 +278,41 @@ class BlogAgent:
             if errors:
                 logger.error("Cleanup errors occurred:\n" + "\n".join(errors))
             self._is_closed = True
-            self.sessions = []
+            self._session = None
+            self._connector = None
 
-    async def process(self):
-        """Main processing method."""
-        async with self:
-            return await self.run()
+    async def run(self) -> Tuple[str, str]:
+        """Generate the blog post with the generator for this agent type.
+        Must be called inside the agent's async context so services are initialized.
+        Returns:
+            Tuple[str, str]: A tuple containing (filename, blog_page)
+        """
+        generator = (
+            ArtistPostGenerator(self) if self.agent_type == BLOG_ARTIST_AI_AGENT
+            else ResearcherPostGenerator(self)
+        )
+        return await generator.generate_blog_post()
 
-    async def run(self):
-        try:
-            generator = (
-                ArtistPostGenerator(self) if self.agent_type == BLOG_ARTIST_AI_AGENT
-                else ResearcherPostGenerator(self)
-            )
-            return await generator.generate()
-        except Exception as e:
-            logger.error(f"Error during generation: {str(e)}")
-            return None
+    async def load_prompts(self, reload: bool = False):
+        """Read all prompt and template files once and keep them in memory."""
+        if self._prompt_cache and not reload:
+            return
+            
+        paths = {
+            'agent_prompt': self.agent_prompt_path,
+            'enhanced_prompt': self.enhanced_prompt_path,
+            'disclaimer': self.disclaimer_path,
+            'blog_template': self.blog_page_template_path,
+            'frontmatter': self.frontmatter_path,
+            'tags': self.tags_prompt_path,
+            'title': self.title_prompt_path,
+            'five_words': self.five_words_prompt_path,
+            'summarize_content': self.summarize_content_path
+        }
+        contents = await asyncio.gather(*[self.read_file(path) for path in paths.values()])
+        self._prompt_cache = dict(zip(paths.keys(), contents))
 
-    async def read_file(self, filepath: str) -> Optional[str]:
+    async def read_file(self, filepath: Path) -> Optional[str]:
         """Read a file asynchronously."""
         try:
             async with aiofiles.open(filepath, mode='r') as file:
@@ -304,40 +321,40 @@ class BlogAgent:
             logger.error(f"Error reading file {filepath}: {str(e)}")
             return None
 
-    async def generate_title(self, content: str) -> str:
+    async def generate_title(self, content: str, cache: bool = True) -> str:
         """Generate a title from the content."""
         default_title = "Default Title Post Is Here"
         if not content:
             return default_title
             
         try:
-            prompt = await self.read_file(str(self.title_prompt_path))
-            response = await self.anthropic.ask(prompt.format(content=content))
+            prompt = self._prompt_cache['title']
+            response = await self.anthropic.ask(prompt.format(content=content), cache=cache)
             return f'{response.replace('"', "").strip()}' if response else default_title
         except Exception as e:
             logger.error(f"Title generation error: {str(e)}")
             return default_title
 
-    async def generate_filename(self, content: str) -> str:
+    async def generate_filename(self, content: str, cache: bool = True) -> str:
         """Generate a 5-word summary for use in the filename."""
         default_title = "Default-Title-Post-Is-Here"
         try:
-            prompt = await self.read_file(str(self.five_words_prompt_path))
-            response = await self.anthropic.ask(prompt.format(content=content))
+            prompt = self._prompt_cache['five_words']
+            response = await self.anthropic.ask(prompt.format(content=content), cache=cache)
             if response:
-                summary = response.strip().replace(' ', '-')
-                words = summary.split('-')
-                return '-'.join(words[:5] if len(words) > 5 else words + ['Update'] * (5 - len(words)))
+                # The prompt asks for hyphenated words, but the model sometimes uses spaces
+                words = response.replace('-', ' ').split()[:5]
+                return '-'.join((*words, *_FILENAME_PAD[len(words):]))
             return default_title
         except Exception as e:
             logger.error(f"Title summary generation error: {str(e)}")
             return default_title
 
-    async def generate_tags(self, content: str) -> str:
+    async def generate_tags(self, content: str, cache: bool = True) -> str:
         """Generate tags for the content."""
         try:
-            tags_prompt = await self.read_file(str(self.tags_prompt_path))
-            return await self.anthropic.ask(tags_prompt.format(content=content))
+            tags_prompt = self._prompt_cache['tags']
+            return await self.anthropic.ask(tags_prompt.format(content=content), cache=cache)
         except Exception as e:
             logger.error(f"Tags generation error: {str(e)}")
             return "[]"
@@ -359,19 +376,13 @@ class BlogAgent:
             # Create full filepath
             obsidian_ai_posts_filepath = OBSIDIAN_AI_POSTS_PATH / filename
             
-            # Write content to file
-            async with aiofiles.open(obsidian_ai_posts_filepath, mode='w') as file:
-                await file.write(content)
+            # Write content to file; a single small write is cheaper in a worker thread than via aiofiles
+            await asyncio.to_thread(obsidian_ai_posts_filepath.write_text, content, 'utf-8')
             
-            logger.info(f"Successfully saved to {obsidian_ai_posts_filepath}")
+            logger.info("Successfully saved to %s", obsidian_ai_posts_filepath)
             # Output the file path in the format expected by deploy_manager
             print(f"POST_FILE_PATH={obsidian_ai_posts_filepath}")
             return str(obsidian_ai_posts_filepath)
         except Exception as e:
             logger.error(f"Error saving to Posts: {str(e)}")
-            return None
-
-    async def close(self):
-        """Clean up any resources used by the agent."""
-        if hasattr(self, 'client') and self.client:
-            await self.client.close()
\ No newline at end of file
+            return None
\ No newline at end of file
@@ -1,4 +1,5 @@
 import os
+import asyncio
 from pathlib import Path
 import sys
 from dotenv import load_dotenv
@@ -57,6 +58,10 @@ BLOG_ARTIST_RANDOM_PROMPT_ARTIST = "random_prompt_artist"
 CLAUDE_MODEL = "claude-3-haiku-20240307"
 OPENAI_MODEL = "gpt-4o-mini"
 
+# Anthropic response cache, shared by all agents in the process
+ANTHROPIC_RESPONSE_CACHE_SIZE = 512
+ANTHROPIC_RESPONSE_CACHE_TTL = 300  # seconds
+
 MIDJOURNEY_ASPECT_RATIO = "7:4"
 MIDJOURNEY_CHAOS_PERCENTAGE = "0"  # Default value, will be overridden by UI
     
@@ -92,6 +97,14 @@ def setup_logging():
 # Create logger instance
 logger = setup_logging()
 
+# Use uvloop for the asyncio event loop when it is available (not supported on Windows)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+logger.debug("Event loop policy: %s", type(asyncio.get_event_loop_policy()).__name__)
+
 class FilenameManager:
     def __init__(self):
         self._filename = "0000000000"
@@ -102,7 +115,7 @@ class FilenameManager:
     
     def update(self, new_filename: str):
         self._filename = new_filename
-        logger.info(f"Updated IMAGE_FILENAME to: {self._filename}")
+        logger.info("Updated IMAGE_FILENAME to: %s", self._filename)
 
 class ChaosPercentageManager:
     def __init__(self):
@@ -114,7 +127,7 @@ class ChaosPercentageManager:
     
     def update(self, new_percentage: str):
         self._chaos_percentage = new_percentage
-        logger.info(f"Updated MIDJOURNEY_CHAOS_PERCENTAGE to: {self._chaos_percentage}")
+        logger.info("Updated MIDJOURNEY_CHAOS_PERCENTAGE to: %s", self._chaos_percentage)
 
 # Create instances
 filename_manager = FilenameManager()
@@ -72,25 +72,25 @@ class DeploymentManager:
         """Verify and sync all images from Obsidian to website folder, including AI images."""
         try:
             self.logger.info("Verifying and syncing images:")
-            self.logger.info(f"  Source: {self.images_source}")
-            self.logger.info(f"  Destination: {self.images_dest}")
+            self.logger.info("  Source: %s", self.images_source)
+            self.logger.info("  Destination: %s", self.images_dest)
 
             # Validate directories
             for directory in [self.dest_path, self.images_source, self.images_dest]:
                 if not directory.exists():
                     self.logger.error(f"  Directory not found: {directory}")
                     raise FileNotFoundError(f"Directory not found: {directory}")
-                self.logger.debug(f"  ✓ Validated: {directory}")
+                self.logger.debug("  ✓ Validated: %s", directory)
 
             # Create destination directory if it doesn't exist
             self.images_dest.mkdir(parents=True, exist_ok=True)
 
             # Verify markdown files for standard images
             md_files = list(self.dest_path.glob('*.md'))
-            self.logger.info(f"Verifying {len(md_files)} markdown files:")
+            self.logger.info("Verifying %s markdown files:", len(md_files))
 
             for filepath in md_files:
-                self.logger.info(f"  File: {filepath.name}")
+                self.logger.info("  File: %s", filepath.name)
                 with open(filepath, "r") as file:
                     content = file.read()
                 
@@ -102,7 +102,7 @@ class DeploymentManager:
                 # Verify and copy markdown images
                 markdown_links = re.findall(r'!\[.*?\]\(/images/([^)]+)\)', content)
                 if markdown_links:
-                    self.logger.info(f"    Found {len(markdown_links)} image references:")
+                    self.logger.info("    Found %s image references:", len(markdown_links))
                     for image in markdown_links:
                         source_path = self.images_source / image
                         dest_path = self.images_dest / image
@@ -111,10 +111,10 @@ class DeploymentManager:
                         if source_path.exists():
                             # Copy image if it doesn't exist in destination or if source is newer
                             if not dest_path.exists() or (source_path.stat().st_mtime > dest_path.stat().st_mtime):
-                                self.logger.info(f"      Copying: {image}")
+                                self.logger.info("      Copying: %s", image)
                                 shutil.copy2(source_path, dest_path)
                                 self.changes_made = True
-                            self.logger.info(f"      ✓ {dest_path}")
+                            self.logger.info("      ✓ %s", dest_path)
                         else:
                             self.logger.warning(f"      ✗ Source image missing: {source_path}")
                 else:
@@ -122,15 +122,15 @@ class DeploymentManager:
 
             # --- New Section: Sync AI Images ---
             self.logger.info("Verifying and syncing AI images:")
-            self.logger.info(f"  AI Source: {self.ai_images_source}")
-            self.logger.info(f"  AI Destination: {self.ai_images_dest}")
+            self.logger.info("  AI Source: %s", self.ai_images_source)
+            self.logger.info("  AI Destination: %s", self.ai_images_dest)
 
             # Validate AI image directories
             for directory in [self.ai_images_source, self.ai_images_dest]:
                 if not directory.exists():
-                    self.logger.info(f"  Creating directory: {directory}")
+                    self.logger.info("  Creating directory: %s", directory)
                     directory.mkdir(parents=True, exist_ok=True)
-                self.logger.debug(f"  ✓ Validated: {directory}")
+                self.logger.debug("  ✓ Validated: %s", directory)
 
             # Create AI destination directory if it doesn't exist
             self.ai_images_dest.mkdir(parents=True, exist_ok=True)
@@ -139,16 +139,16 @@ class DeploymentManager:
             for source_file in self.ai_images_source.glob('*'):
                 dest_file = self.ai_images_dest / source_file.name
                 if not dest_file.exists() or (source_file.stat().st_mtime > dest_file.stat().st_mtime):
-                    self.logger.info(f"      Copying AI image: {source_file.name}")
+                    self.logger.info("      Copying AI image: %s", source_file.name)
                     shutil.copy2(source_file, dest_file)
                     self.changes_made = True
-                self.logger.info(f"      ✓ {dest_file}")
+                self.logger.info("      ✓ %s", dest_file)
 
             # Delete AI images in destination that no longer exist in source
             for dest_file in self.ai_images_dest.glob('*'):
                 source_file = self.ai_images_source / dest_file.name
                 if not source_file.exists():
-                    self.logger.info(f"      Deleting AI image: {dest_file.name}")
+                    self.logger.info("      Deleting AI image: %s", dest_file.name)
                     dest_file.unlink()
                     self.changes_made = True
 
@@ -172,14 +172,14 @@ class DeploymentManager:
             files_to_remove = dest_files - source_files
             for filename in files_to_remove:
                 file_to_remove = self.dest_path / filename
-                self.logger.info(f"Removing file: {filename}")
+                self.logger.info("Removing file: %s", filename)
                 file_to_remove.unlink()
                 self.changes_made = True
             
             # Process source files
             files_processed = 0
             for source_file in self.origin_path.glob('*.md'):
-                self.logger.info(f"Checking file: {source_file.name}")
+                self.logger.info("Checking file: %s", source_file.name)
                 
                 dest_file = self.dest_path / source_file.name
 
@@ -197,7 +197,7 @@ class DeploymentManager:
                 
             if files_processed > 0 or files_to_remove:
                 self.changes_made = True
-                self.logger.info(f"Content sync completed successfully ({files_processed} files updated, {len(files_to_remove)} files removed)")
+                self.logger.info("Content sync completed successfully (%s files updated, %s files removed)", files_processed, len(files_to_remove))
             else:
                 self.logger.info("No files needed updating")
             return True
@@ -212,14 +212,14 @@ class DeploymentManager:
         images = re.findall(r'\[\[([^]]*\.png)\]\]', content)
         
         for image in images:
-            self.logger.info(f"    Processing image: {image}")
+            self.logger.info("    Processing image: %s", image)
             new_image_name = image.replace(' ', '_')
             
             obsidian_image = self.images_source / image
             new_obsidian_image = self.images_source / new_image_name
             if obsidian_image.exists() and obsidian_image != new_obsidian_image:
                 obsidian_image.rename(new_obsidian_image)
-                self.logger.info(f"    ✓ Renamed Obsidian image: {image} -> {new_image_name}")
+                self.logger.info("    ✓ Renamed Obsidian image: %s -> %s", image, new_image_name)
                 self.changes_made = True
             
             markdown_image = f"![Image](/images/{new_image_name})"
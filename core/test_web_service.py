@@ -0,0 +1,22 @@
+import httpx
+import pytest
+
+from blogi.core.web_service import WebService
+
+
+def make_service(content_type: str, body: bytes) -> WebService:
+    def handler(request):
+        return httpx.Response(200, headers={'content-type': content_type}, content=body)
+    return WebService(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+@pytest.mark.asyncio
+async def test_unknown_charset_falls_back_to_utf8():
+    service = make_service('text/html; charset=bogus-xyz', '<main><p>Café  news</p></main>'.encode('utf-8'))
+    assert await service.fetch_webpage_content('http://example.com') == 'Café news'
+
+
+@pytest.mark.asyncio
+async def test_declared_charset_is_used():
+    service = make_service('text/html; charset=latin-1', '<main><p>Café</p></main>'.encode('latin-1'))
+    assert await service.fetch_webpage_content('http://example.com') == 'Café'
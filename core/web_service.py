@@ -1,25 +1,61 @@
-import aiohttp
+import codecs
+import httpx
 import logging
 import re
 from typing import Optional
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from blogi.core.config import logger
 from contextlib import asynccontextmanager
 
+# Enough markup for the 10k character text excerpt without downloading huge pages
+_MAX_CONTENT_BYTES = 200_000
+_CHUNK_SIZE = 8192
+_TEXT_CONTENT_TYPES = ('text/', 'application/xhtml')
+_UNWANTED_SELECTOR = 'script, style, nav, header, footer'
+_SCRIPT_SELECTOR = 'script, style'
+_CONTENT_SELECTOR = 'div[class*="content"], div[class*="article"], div[class*="post"]'
+_WS_RE = re.compile(r'\s+')
+
+def _resolve_encoding(charset: Optional[str]) -> str:
+    """Return the declared charset if Python knows it, otherwise fall back to UTF-8."""
+    if charset:
+        try:
+            return codecs.lookup(charset).name
+        except LookupError:
+            logger.debug("Unknown charset %s, decoding as utf-8", charset)
+    return 'utf-8'
+
 class WebService:
-    def __init__(self):
-        """Initialize the web service."""
-        self._session = None
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """Initialize the web service.
+        Args:
+            client (Optional[httpx.AsyncClient]): Shared client owned by the caller
+        """
+        self._client = client
+        self._owns_client = client is None
+
+    def _create_client(self) -> httpx.AsyncClient:
+        # HTTP/2 lets requests to the same host share one multiplexed connection
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=30.0,
+            follow_redirects=True
+        )
 
     @asynccontextmanager
-    async def get_session(self):
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
-        try:
-            yield self._session
-        finally:
-            if self._session and not self._session.closed:
-                await self._session.close()
+    async def get_client(self):
+        # The client outlives each request so its connection pool is reused
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+            self._owns_client = True
+        yield self._client
+
+    async def close(self):
+        """Close the client if this service created it."""
+        if self._owns_client and self._client and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
 
     async def get(self, url: str) -> Optional[str]:
         """Make a GET request to the specified URL.
@@ -28,42 +64,61 @@ class WebService:
         Returns:
             Optional[str]: The response text or None if request fails
         """
-        async with self.get_session() as session:
+        async with self.get_client() as client:
             try:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        return await response.text()
-                    logger.error(f"HTTP error {response.status} for URL: {url}")
-                    return None
+                response = await client.get(url)
+                if response.status_code == 200:
+                    return response.text
+                logger.error(f"HTTP error {response.status_code} for URL: {url}")
+                return None
             except Exception as e:
                 logger.error(f"Error fetching URL {url}: {str(e)}")
                 return None
 
     async def fetch_webpage_content(self, url: str) -> Optional[str]:
         """Fetch and extract main content from a webpage."""
-        async with self.get_session() as session:
+        async with self.get_client() as client:
             try:
                 headers = {
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 }
-                async with session.get(url, headers=headers, timeout=30) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        soup = BeautifulSoup(html, 'html.parser')
-                        
-                        # Clean up the HTML
-                        for element in soup(["script", "style", "nav", "header", "footer"]):
-                            element.decompose()
-                        
-                        # Extract main content
-                        main_content = (
-                            soup.find('main') or 
-                            soup.find('article') or 
-                            soup.find('div', class_=re.compile(r'content|article|post'))
-                        )
-                        
-                        text = (main_content or soup).get_text(separator=' ', strip=True)
-                        return re.sub(r'\s+', ' ', text)[:10000]
+                async with client.stream('GET', url, headers=headers) as response:
+                    if response.status_code != 200:
+                        return None
+
+                    content_type = response.headers.get('content-type', '').lower()
+                    if content_type and not content_type.startswith(_TEXT_CONTENT_TYPES):
+                        logger.info("Skipping non-text content (%s) for URL: %s", content_type, url)
+                        return None
+
+                    # Stop reading once enough markup has arrived for the text excerpt
+                    body = bytearray()
+                    async for chunk in response.aiter_bytes(_CHUNK_SIZE):
+                        body.extend(chunk)
+                        if len(body) >= _MAX_CONTENT_BYTES:
+                            break
+                    encoding = _resolve_encoding(response.charset_encoding)
+
+                html = body.decode(encoding, errors='replace')
+                tree = LexborHTMLParser(html)
+
+                # Extract main content first so only that subtree gets cleaned
+                main_content = (
+                    tree.css_first('main') or
+                    tree.css_first('article') or
+                    tree.css_first(_CONTENT_SELECTOR)
+                )
+
+                root = main_content or tree.body or tree.root
+                if root is None:
+                    return None
+
+                # Page chrome rarely sits inside the main container, so only scripts and styles need removing there
+                for node in root.css(_SCRIPT_SELECTOR if main_content else _UNWANTED_SELECTOR):
+                    node.decompose()
+
+                text = root.text(separator=' ', strip=True)
+                return _WS_RE.sub(' ', text)[:10000]
             except Exception as e:
                 logger.error(f"Error fetching webpage {url}: {str(e)}")
-                return None 
\ No newline at end of file
+                return None
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from typing import Tuple, Optional, Dict
 from pathlib import Path
@@ -13,18 +14,18 @@ class ArtistPostGenerator:
         self.image_service = None
         self.filename = None
         
-    async def _load_templates(self) -> Dict[str, str]:
+    def _load_templates(self) -> Dict[str, str]:
         templates = {}
-        paths = {
-            'agent_prompt': self.agent.agent_prompt_path,
-            'enhanced_prompt': self.agent.enhanced_prompt_path,
-            'disclaimer': self.agent.disclaimer_path,
-            'frontmatter': self.agent.frontmatter_path,
-            'blog_template': self.agent.blog_page_template_path
-        }
+        names = (
+            'agent_prompt',
+            'enhanced_prompt',
+            'disclaimer',
+            'frontmatter',
+            'blog_template'
+        )
         
-        for name, path in paths.items():
-            content = await self.agent.read_file(str(path))
+        for name in names:
+            content = self.agent._prompt_cache.get(name)
             if not content:
                 raise ValueError(f"Failed to load template: {name}")
             templates[name] = content
@@ -39,13 +40,14 @@ class ArtistPostGenerator:
         logger.info("\n=== Starting Blog Post Generation ===")
         try:
             logger.info("Loading templates...")
-            templates = await self._load_templates()
+            templates = self._load_templates()
             
             logger.info("Requesting blog content from AI...")
             blog_content = await self.agent.anthropic.ask(
-                self._format_prompt(templates['agent_prompt'], templates['enhanced_prompt'])
+                self._format_prompt(templates['agent_prompt'], templates['enhanced_prompt']),
+                cache=False
             )
-            logger.info(f"Received blog content (length: {len(blog_content) if blog_content else 0} characters)")
+            logger.info("Received blog content (length: %s characters)", len(blog_content) if blog_content else 0)
             
             if not blog_content:
                 logger.error("Failed to generate blog content")
@@ -53,7 +55,7 @@ class ArtistPostGenerator:
                 
             logger.info("Generating metadata...")
             metadata = await self._generate_metadata(self.agent.image_prompt)
-            logger.info(f"Generated metadata: {metadata}")
+            logger.info("Generated metadata: %s", metadata)
             
             self.filename = self._generate_filename(metadata['filename'])
 
@@ -80,16 +82,16 @@ class ArtistPostGenerator:
             try:
                 # Create tmp directory if it doesn't exist
                 config_path.parent.mkdir(parents=True, exist_ok=True)
-                logger.info(f"Ensuring directory exists: {config_path.parent}")
+                logger.info("Ensuring directory exists: %s", config_path.parent)
                 
                 # Create or update the config file
                 with open(config_path, 'w', encoding='utf-8') as f:
                     json.dump(config_data, f, ensure_ascii=False, indent=2)
-                logger.info(f"Saved blog content to config file: {config_path}")
+                logger.info("Saved blog content to config file: %s", config_path)
                 
                 # Verify file was created
                 if config_path.exists():
-                    logger.info(f"Verified config file exists. Size: {config_path.stat().st_size} bytes")
+                    logger.info("Verified config file exists. Size: %s bytes", config_path.stat().st_size)
                 else:
                     logger.error(f"Failed to create config file at: {config_path.absolute()}")
                     
@@ -99,7 +101,7 @@ class ArtistPostGenerator:
                 logger.error(f"Current working directory: {Path.cwd()}")
                 raise  # Re-raise the exception for the outer try-catch block
             
-            logger.info(f"Blog post generation completed successfully. Filename: {self.filename}")
+            logger.info("Blog post generation completed successfully. Filename: %s", self.filename)
             logger.info("=== Blog Post Generation Completed ===\n")
             
             return self.filename, blog_page
@@ -113,7 +115,7 @@ class ArtistPostGenerator:
         filename_manager.update(self.filename)
         
         image_filename = filename_manager.filename.replace('.md', '')  # Remove .md extension
-        logger.info(f"SAVED IMAGE_FILENAME: {image_filename}")
+        logger.info("SAVED IMAGE_FILENAME: %s", image_filename)
         
         return {
             'tl': f"/images/ai_images/{image_filename}_tl.png",
@@ -130,10 +132,17 @@ class ArtistPostGenerator:
         return f"{formatted_prompt}\n\n{enhanced_prompt}"
 
     async def _generate_metadata(self, content: str) -> Dict[str, str]:
+        # The image prompt repeats across runs, so cached metadata would reuse the
+        # previous post's filename and overwrite it along with its images
+        title, tags, filename = await asyncio.gather(
+            self.agent.generate_title(content, cache=False),
+            self.agent.generate_tags(content, cache=False),
+            self.agent.generate_filename(content, cache=False)
+        )
         return {
-            'title': await self.agent.generate_title(content),
-            'tags': await self.agent.generate_tags(content),
-            'filename': await self.agent.generate_filename(content),
+            'title': title,
+            'tags': tags,
+            'filename': filename,
             'date': datetime.now().strftime('%Y-%m-%d')
         }
 
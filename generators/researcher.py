@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from typing import Tuple, Optional, List, Dict
 import logging
@@ -9,19 +10,19 @@ class ResearcherPostGenerator:
     def __init__(self, agent):
         self.agent = agent
         
-    async def _load_templates(self) -> Dict[str, str]:
+    def _load_templates(self) -> Dict[str, str]:
         templates = {}
-        paths = {
-            'agent_prompt': self.agent.agent_prompt_path,
-            'enhanced_prompt': self.agent.enhanced_prompt_path,
-            'disclaimer': self.agent.disclaimer_path,
-            'frontmatter': self.agent.frontmatter_path,
-            'blog_template': self.agent.blog_page_template_path,
-            'summarize_content': self.agent.summarize_content_path
-        }
+        names = (
+            'agent_prompt',
+            'enhanced_prompt',
+            'disclaimer',
+            'frontmatter',
+            'blog_template',
+            'summarize_content'
+        )
         
-        for name, path in paths.items():
-            content = await self.agent.read_file(str(path))
+        for name in names:
+            content = self.agent._prompt_cache.get(name)
             if not content:
                 raise ValueError(f"Failed to load template: {name}")
             templates[name] = content
@@ -35,25 +36,25 @@ class ResearcherPostGenerator:
         """
         try:
             # Load templates and store them as instance variable
-            self.templates = await self._load_templates()
+            self.templates = self._load_templates()
             
-            async with self.agent.web_service.get_session() as session:
-                research_data = await self._gather_research()
-                
-                blog_content = await self.agent.anthropic.ask(
-                    self._format_prompt(self.templates['agent_prompt'], research_data)
-                )
-                
-                if not blog_content:
-                    return "default.md", "Failed to generate content"
-                    
-                metadata = await self._generate_metadata(blog_content)
-                pages = self._format_pages(self.templates, metadata, blog_content)
-                
-                filename = self._generate_filename(metadata['filename'])
-                blog_page = pages['blog_page']
+            research_data = await self._gather_research()
+            
+            blog_content = await self.agent.anthropic.ask(
+                self._format_prompt(self.templates['agent_prompt'], research_data),
+                cache=False
+            )
+            
+            if not blog_content:
+                return "default.md", "Failed to generate content"
                 
-                return filename, blog_page
+            metadata = await self._generate_metadata(blog_content)
+            pages = self._format_pages(self.templates, metadata, blog_content)
+            
+            filename = self._generate_filename(metadata['filename'])
+            blog_page = pages['blog_page']
+            
+            return filename, blog_page
                 
         except Exception as e:
             logger.error(f"Error generating researcher post: {str(e)}")
@@ -62,27 +63,38 @@ class ResearcherPostGenerator:
     async def _gather_research(self) -> List[Dict]:
         try:
             search_results = await self.agent.brave_client.search(self.agent.topic)
-            research_data = []
+            results = await asyncio.gather(
+                *[self._process_result(result) for result in search_results[:3]],
+                return_exceptions=True
+            )
             
-            for result in search_results[:3]:
-                async with self.agent.web_service.get_session() as session:
-                    content = await self.agent.web_service.fetch_webpage_content(result['url'])
-                    if content:
-                        summary = await self.agent.anthropic.ask(
-                            self.templates['summarize_content'] + f"\n\n{content}"
-                        )
-                        research_data.append({
-                            'title': result.get('title', ''),
-                            'url': result.get('url', ''),
-                            'description': result.get('description', ''),
-                            'content_summary': summary
-                        })
+            research_data = []
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error processing search result: {str(result)}")
+                elif result:
+                    research_data.append(result)
             
             return research_data
         except Exception as e:
             logger.error(f"Error in _gather_research: {str(e)}")
             raise
 
+    async def _process_result(self, result: Dict) -> Optional[Dict]:
+        content = await self.agent.web_service.fetch_webpage_content(result['url'])
+        if not content:
+            return None
+            
+        summary = await self.agent.anthropic.ask(
+            self.templates['summarize_content'].format(content=content)
+        )
+        return {
+            'title': result.get('title', ''),
+            'url': result.get('url', ''),
+            'description': result.get('description', ''),
+            'content_summary': summary
+        }
+
     def _format_research_summary(self, research_data: List[Dict]) -> str:
         return "\n\n".join([
             f"Source: {data['title']}\n"
@@ -106,10 +118,15 @@ class ResearcherPostGenerator:
         return f"{formatted_agent_prompt}\n\n{formatted_enhanced_prompt}"
 
     async def _generate_metadata(self, content: str) -> Dict[str, str]:
+        title, tags, filename = await asyncio.gather(
+            self.agent.generate_title(content),
+            self.agent.generate_tags(content),
+            self.agent.generate_filename(content)
+        )
         return {
-            'title': await self.agent.generate_title(content),
-            'tags': await self.agent.generate_tags(content),
-            'filename': await self.agent.generate_filename(content),
+            'title': title,
+            'tags': tags,
+            'filename': filename,
             'date': datetime.now().strftime('%Y-%m-%d')
         }
 
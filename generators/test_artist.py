@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import pytest
+
+from blogi.core.agent import BlogAgent
+from blogi.core.config import BLOG_ARTIST_AI_AGENT, BLOG_ARTIST_PROMPT_ARTIST
+from blogi.generators.artist import ArtistPostGenerator
+from blogi.services.anthropic_service import AnthropicService
+
+
+class FakeMessages:
+    def __init__(self):
+        self.prompts = []
+
+    async def create(self, **kwargs):
+        prompt = kwargs['messages'][0]['content']
+        self.prompts.append(prompt)
+        return SimpleNamespace(content=[SimpleNamespace(text=f"Response-{len(self.prompts)}")])
+
+
+async def run_artist_metadata(image_prompt: str, messages: FakeMessages):
+    # Mirror BlogAgent.create: a fresh agent and Anthropic service on every run
+    agent = BlogAgent(
+        agent_name=BLOG_ARTIST_PROMPT_ARTIST,
+        agent_type=BLOG_ARTIST_AI_AGENT,
+        image_prompt=image_prompt,
+        webhook_url="http://localhost"
+    )
+    await agent.load_prompts()
+    agent.anthropic = AnthropicService(agent.model)
+    agent.anthropic.client = SimpleNamespace(messages=messages)
+    return agent, await ArtistPostGenerator(agent)._generate_metadata(image_prompt)
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    AnthropicService._response_cache.clear()
+    yield
+    AnthropicService._response_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_repeated_image_prompt_requests_a_new_filename():
+    messages = FakeMessages()
+    agent, first = await run_artist_metadata("a red fox", messages)
+    _, second = await run_artist_metadata("a red fox", messages)
+
+    five_words_prefix = agent._prompt_cache['five_words'].partition("{content}")[0].strip()
+    filename_calls = [prompt for prompt in messages.prompts if prompt.startswith(five_words_prefix)]
+    assert len(filename_calls) == 2
+    assert first['filename'] != second['filename']
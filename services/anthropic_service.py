@@ -1,12 +1,19 @@
 import anthropic
-from anthropic import AI_PROMPT, HUMAN_PROMPT
-import aiohttp
-from typing import Optional
+from typing import Optional, Tuple
 import logging
 import os
-from blogi.core.config import logger
+import hashlib
+import time
+import threading
+from collections import OrderedDict
+from blogi.core.config import logger, ANTHROPIC_RESPONSE_CACHE_SIZE, ANTHROPIC_RESPONSE_CACHE_TTL
 
 class AnthropicService:
+    # LRU of (expires_at, response) keyed by prompt hash, shared across instances
+    _response_cache: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+    # Flask runs async views on per-thread event loops, so guard the shared cache
+    _response_cache_lock = threading.Lock()
+
     def __init__(self, model: str):
         """Initialize the Anthropic service.
         Args:
@@ -14,24 +21,60 @@ class AnthropicService:
         """
         self.model = model
         self.client = anthropic.AsyncAnthropic()
-        self.session = None
         self._is_closed = False
 
-    async def ask(self, prompt: str) -> str:
-        """Send a prompt to the Anthropic API using the Messages API."""
+    def _cache_key(self, prompt: str) -> bytes:
+        return hashlib.blake2b(f"{self.model}|{prompt}".encode(), digest_size=16).digest()
+
+    def _get_cached(self, key: bytes) -> Optional[str]:
+        with self._response_cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at < time.monotonic():
+                self._response_cache.pop(key, None)
+                return None
+            self._response_cache.move_to_end(key)
+            return response
+
+    def _set_cached(self, key: bytes, response: str):
+        with self._response_cache_lock:
+            self._response_cache[key] = (time.monotonic() + ANTHROPIC_RESPONSE_CACHE_TTL, response)
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > ANTHROPIC_RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+    async def ask(self, prompt: str, cache: bool = True) -> str:
+        """Send a prompt to the Anthropic API using the Messages API.
+        Args:
+            prompt (str): The prompt to send
+            cache (bool): Reuse a recent response to the same prompt and model
+        """
         if self._is_closed:
             raise RuntimeError("Service has been closed")
 
+        content = prompt.strip()
+        key = self._cache_key(content) if cache else None
+        if key is not None:
+            cached = self._get_cached(key)
+            if cached is not None:
+                logger.debug("Anthropic response cache hit")
+                return cached
+
         try:
             response = await self.client.messages.create(
                 model=self.model,
                 system="You are a helpful assistant.",
                 messages=[
-                    {"role": "user", "content": prompt.strip()},
+                    {"role": "user", "content": content},
                 ],
                 max_tokens=300
             )
-            return response.content[0].text
+            text = response.content[0].text
+            if key is not None and text:
+                self._set_cached(key, text)
+            return text
         except Exception as e:
             logger.error(f"Error in Anthropic API call: {str(e)}")
             return ""
@@ -42,11 +85,11 @@ class AnthropicService:
             return
             
         try:
-            if self.session and not self.session.closed:
-                await self.session.close()
+            # The SDK keeps its own connection pool
+            if self.client:
+                await self.client.close()
         except Exception as e:
             logger.error(f"Error during cleanup: {str(e)}")
         finally:
             self._is_closed = True
-            self.session = None
             self.client = None
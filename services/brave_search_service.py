@@ -4,12 +4,16 @@ from typing import Optional, List, Dict, Any
 from blogi.core.config import logger
 
 class BraveSearchClient:
-    def __init__(self):
-        """Initialize the Brave Search client."""
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """Initialize the Brave Search client.
+        Args:
+            session (Optional[aiohttp.ClientSession]): Shared session owned by the caller
+        """
         self.api_key = os.getenv('BRAVE_API_KEY')
         if not self.api_key:
             raise ValueError("BRAVE_API_KEY not found in environment variables")
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         self.base_url = "https://api.search.brave.com/res/v1/web/search"
 
     async def search(self, query: str) -> List[Dict[str, Any]]:
@@ -19,8 +23,9 @@ class BraveSearchClient:
         Returns:
             List[Dict[str, Any]]: List of search results
         """
-        if not self.session:
+        if not self.session or self.session.closed:
             self.session = aiohttp.ClientSession()
+            self._owns_session = True
         try:
             headers = {
                 "Accept": "application/json",
@@ -44,5 +49,6 @@ class BraveSearchClient:
 
     async def cleanup(self):
         """Cleanup resources."""
-        if self.session and not self.session.closed:
+        # A shared session is closed by its owner, not here
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
\ No newline at end of file
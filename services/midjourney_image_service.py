@@ -1,4 +1,5 @@
 import os
+import asyncio
 import requests
 import time
 import logging
@@ -28,7 +29,7 @@ class MidjourneyImageService:
         webhook_base = webhook_url.rstrip('/') + '/imagine/webhook'
         image_filename = filename_manager.filename.replace('.md', '') # Remove .md extension
         self.webhook_url = f"{webhook_base}?image_filename={image_filename}"
-        logger.info(f"INIT MidjourneyImageService WITH WEBHOOK URL: {self.webhook_url}")
+        logger.info("INIT MidjourneyImageService WITH WEBHOOK URL: %s", self.webhook_url)
         self.headers = {
             "api-key": self.api_key,
             "Content-Type": "application/json"
@@ -48,7 +49,7 @@ class MidjourneyImageService:
         # Initialize generation request
         response = await self._generate_quad_image_async()
 
-        logger.info(f"\n\n*********\n\n_generate_quad_image_async Response Body: {response}\n\n*********\n\n")
+        logger.info("\n\n*********\n\n_generate_quad_image_async Response Body: %s\n\n*********\n\n", response)
 
         if not response:
             raise RuntimeError("Failed to get response from image generation service")
@@ -58,12 +59,12 @@ class MidjourneyImageService:
         if not response_hash:
             raise RuntimeError("Failed to get response_hash from image generation response")
             
-        logger.info(f"Image generation task initiated with hash: {response_hash}")
+        logger.info("Image generation task initiated with hash: %s", response_hash)
 
     async def _generate_quad_image_async(self):
         """Make the initial request to generate a QUAD image asynchronously"""
         
-        logger.info(f"Make the initial request to generate a QUAD image WITH WEBHOOK URL: {self.webhook_url}")
+        logger.info("Make the initial request to generate a QUAD image WITH WEBHOOK URL: %s", self.webhook_url)
         
         payload = {
             "prompt": self.prompt,
@@ -72,15 +73,17 @@ class MidjourneyImageService:
             "account_hash": self.account_hash,
             "is_disable_prefilter": True
         }
-        logger.info(f"\n\n++++++++++++\n\npayload: {payload}\n\n++++++++++++\n\n")
+        logger.info("\n\n++++++++++++\n\npayload: %s\n\n++++++++++++\n\n", payload)
         
-        response = requests.post(
+        # requests is blocking, so run it in a worker thread to keep the event loop free
+        response = await asyncio.to_thread(
+            requests.post,
             f"{USERAPI_AI_API_BASE_URL}/imagine",
             headers=self.headers,
             json=payload,
             timeout=30
         )
-        logger.info(f"\n\n++++++++++++\n\nresponse: {response}\n\n++++++++++++\n\n")
+        logger.info("\n\n++++++++++++\n\nresponse: %s\n\n++++++++++++\n\n", response)
         
         
         response.raise_for_status()
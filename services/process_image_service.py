@@ -12,8 +12,12 @@ from blogi.core.config import logger, PROMPTS_DIR
 class ProcessImageService:
 
     def __init__(self, agent_name: str, image_prompt: str, webhook_url: str):
+            """Initialize the image processing service.
+            Image generation is started separately by awaiting initialize().
+            """
             try:
                 self.webhook_url = webhook_url
+                self.session: Optional[aiohttp.ClientSession] = None
 
                 # AI Agent prompts and templates
                 self.agent_prompt_path = PROMPTS_DIR / agent_name / "agent_prompt.txt"
@@ -26,13 +30,12 @@ class ProcessImageService:
                 for path in [self.agent_prompt_path, self.enhanced_prompt_path, self.disclaimer_path]:
                     if not os.path.exists(path):
                         raise FileNotFoundError(f"Required prompt file not found: {path}")
-
-                self._get_image_and_description()
             except Exception as e:
                 logger.error(f"ProcessImageService initialization error: {str(e)}")
                 raise
 
-    def _get_image_and_description(self):
+    async def initialize(self):
+        """Request the image and description without blocking the event loop."""
         try:
             logger.info("Initializing OpenAIRandomImagePromptService")
 
@@ -45,15 +48,11 @@ class ProcessImageService:
 
             # Run the service
             midjourney_service = MidjourneyImageService(api_key=api_key, account_hash=account_hash, prompt=self.image_prompt, webhook_url=self.webhook_url)
-            midjourney_service.run_async()
+            await midjourney_service.run_async()
         except Exception as e:
-            logger.error(f"Error in _get_image_and_description: {str(e)}")
+            logger.error(f"Error in initialize: {str(e)}")
             raise
 
-    def __init__(self):
-        """Initialize the image processing service."""
-        self.session: Optional[aiohttp.ClientSession] = None
-
     async def setup(self):
         """Set up the service session."""
         if not self.session or self.session.closed:
@@ -85,14 +84,15 @@ class ProcessImageService:
             await self.session.close()
 
 # Example usage:
-async def generate_blog_image(prompt: str, webhook_url: str) -> bool:
+async def generate_blog_image(agent_name: str, prompt: str, webhook_url: str) -> bool:
     image_service = ProcessImageService(
+        agent_name=agent_name,
         image_prompt=prompt,
         webhook_url=webhook_url
     )
     
     try:
-        success = await image_service.generate_image()
-        return success
+        await image_service.initialize()
+        return True
     finally:
         await image_service.cleanup()
\ No newline at end of file
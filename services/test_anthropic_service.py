@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+
+import pytest
+
+from blogi.services import anthropic_service
+from blogi.services.anthropic_service import AnthropicService
+
+
+class FakeMessages:
+    def __init__(self, text="response"):
+        self.text = text
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(content=[SimpleNamespace(text=self.text)])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(anthropic_service, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def service(clock):
+    AnthropicService._response_cache.clear()
+    service = AnthropicService("test-model")
+    service.client = SimpleNamespace(messages=FakeMessages())
+    yield service
+    AnthropicService._response_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_repeated_prompt_is_served_from_cache(service):
+    assert await service.ask("prompt") == "response"
+    assert await service.ask("prompt") == "response"
+    assert service.client.messages.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_response_expires_after_ttl(service, clock, monkeypatch):
+    monkeypatch.setattr(anthropic_service, "ANTHROPIC_RESPONSE_CACHE_TTL", 10)
+    await service.ask("prompt")
+
+    clock.now += 11
+    await service.ask("prompt")
+    assert service.client.messages.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted(service, monkeypatch):
+    monkeypatch.setattr(anthropic_service, "ANTHROPIC_RESPONSE_CACHE_SIZE", 2)
+    await service.ask("first")
+    await service.ask("second")
+    await service.ask("first")  # refresh "first" so "second" is the oldest
+    await service.ask("third")
+
+    assert len(AnthropicService._response_cache) == 2
+    await service.ask("first")
+    assert service.client.messages.calls == 3
+    await service.ask("second")
+    assert service.client.messages.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_cache_false_bypasses_cache(service):
+    await service.ask("prompt", cache=False)
+    await service.ask("prompt", cache=False)
+    assert service.client.messages.calls == 2
+    assert len(AnthropicService._response_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_empty_response_is_not_cached(service):
+    service.client.messages.text = ""
+    assert await service.ask("prompt") == ""
+    assert len(AnthropicService._response_cache) == 0
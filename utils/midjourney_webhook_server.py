@@ -40,7 +40,7 @@ class MidjourneyWebhookHandler:
     def slice_and_save_images(self, dated_ai_image_path):
         """Slices an image into four equal-sized quadrants and creates thumbnails."""
         try:
-            logger.info(f"Slicing and saving images for dated_ai_image_path: {dated_ai_image_path}")
+            logger.info("Slicing and saving images for dated_ai_image_path: %s", dated_ai_image_path)
 
             img = Image.open(dated_ai_image_path)
             width, height = img.size
@@ -67,7 +67,7 @@ class MidjourneyWebhookHandler:
                 obsidian_output_path = OBSIDIAN_AI_IMAGES / filename
                 try:
                     quadrant.save(obsidian_output_path)
-                    logger.info(f"Saved full-size: {obsidian_output_path}")
+                    logger.info("Saved full-size: %s", obsidian_output_path)
                     
                     # Create and save thumbnail (15% size)
                     thumb_size = (quadrant.width * 15 // 100, quadrant.height * 15 // 100)
@@ -75,7 +75,7 @@ class MidjourneyWebhookHandler:
                     thumb_filename = f"{base_name}_{position}_thumb.png"
                     thumb_path = OBSIDIAN_AI_IMAGES / thumb_filename
                     thumbnail.save(thumb_path)
-                    logger.info(f"Saved thumbnail: {thumb_path}")
+                    logger.info("Saved thumbnail: %s", thumb_path)
                         
                 except Exception as e:
                     logger.error(f"Error saving {obsidian_output_path}: {e}")
@@ -84,14 +84,14 @@ class MidjourneyWebhookHandler:
             img.close()
             # Delete the original image
             Path(dated_ai_image_path).unlink()
-            logger.info(f"Deleted original image: {dated_ai_image_path}")
+            logger.info("Deleted original image: %s", dated_ai_image_path)
         except Exception as e:
             logger.error(f"Error processing image: {e}")
 
     def save_prompt_to_file(self, prompt, prompt_file_path):
         """Save the prompt to a file."""
         try:
-            logger.info(f"Saving prompt to file: {prompt_file_path}")
+            logger.info("Saving prompt to file: %s", prompt_file_path)
             prompt_str = str(prompt) if prompt is not None else "No prompt available"
             Path(prompt_file_path).write_text(prompt_str)
         except Exception as e:
@@ -100,7 +100,7 @@ class MidjourneyWebhookHandler:
     def download_image(self, image_url, download_path):
         """Download an image from a URL."""
         try:
-            logger.info(f"Downloading image from: {image_url}")
+            logger.info("Downloading image from: %s", image_url)
             response = requests.get(image_url)
             response.raise_for_status()
             Path(download_path).write_bytes(response.content)
@@ -112,7 +112,7 @@ class MidjourneyWebhookHandler:
     def save_image_and_prompt(self, image_url, prompt, image_filename):
         """Process and save the image and prompt."""
         try:
-            logger.info(f"Saving image and prompt for image_filename: {image_filename}")
+            logger.info("Saving image and prompt for image_filename: %s", image_filename)
             # Create directories if they don't exist
             BLOG_SITE_STATIC_IMAGES_PATH.mkdir(parents=True, exist_ok=True)
             if OBSIDIAN_AI_IMAGES:
@@ -148,7 +148,7 @@ webhook_handler = MidjourneyWebhookHandler()
 def webhook_handler_route():
     try:
         data = request.json
-        logger.info(f"Received webhook data: {data}")
+        logger.info("Received webhook data: %s", data)
         
         if 'status' in data:
             if data['status'] == 'done':
@@ -160,11 +160,11 @@ def webhook_handler_route():
                 if image_url:
                     # Check if we've already processed this URL
                     if webhook_handler.has_been_processed(image_url):
-                        logger.info(f"Skipping already processed image: {image_url}")
+                        logger.info("Skipping already processed image: %s", image_url)
                         return jsonify({'status': 'success', 'message': 'Already processed'}), 200
                     
-                    logger.info(f"QUAD Image generation completed. URL: {image_url}")
-                    logger.info(f"Using image_filename: {image_filename}")
+                    logger.info("QUAD Image generation completed. URL: %s", image_url)
+                    logger.info("Using image_filename: %s", image_filename)
                     webhook_handler.save_image_and_prompt(image_url, prompt, image_filename)
                     webhook_handler.mark_as_processed(image_url)
                     return jsonify({'status': 'success', 'image_url': image_url}), 200
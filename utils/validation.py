@@ -21,7 +21,7 @@ def check_dependencies() -> bool:
             logger.error(f"Missing dependency: {dep}")
             missing_deps.append(dep)
         else:
-            logger.info(f"Found dependency: {dep}")
+            logger.info("Found dependency: %s", dep)
     
     if missing_deps:
         logger.error(f"Missing dependencies: {', '.join(missing_deps)}")
@@ -32,7 +32,7 @@ def check_dependencies() -> bool:
 
 def verify_paths(agent_name: str) -> bool:
     """Verify that all required paths exist and create them if they don't."""
-    logger.info(f"Verifying paths for agent: {agent_name}")
+    logger.info("Verifying paths for agent: %s", agent_name)
     
     # Use absolute paths based on PROJECT_ROOT
     required_paths = [
@@ -42,17 +42,17 @@ def verify_paths(agent_name: str) -> bool:
     ]
     
     for path in required_paths:
-        logger.info(f"Checking path: {path}")
+        logger.info("Checking path: %s", path)
         if not path.exists():
-            logger.info(f"Creating directory: {path}")
+            logger.info("Creating directory: %s", path)
             try:
                 path.mkdir(parents=True, exist_ok=True)
-                logger.info(f"Successfully created directory: {path}")
+                logger.info("Successfully created directory: %s", path)
             except Exception as e:
                 logger.error(f"Failed to create directory {path}: {str(e)}")
                 return False
         else:
-            logger.info(f"Found existing path: {path}")
+            logger.info("Found existing path: %s", path)
     
     logger.info("All required paths verified/created")
     return True
\ No newline at end of file